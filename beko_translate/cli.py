@@ -7,10 +7,12 @@ import contextlib
 import functools
 import json
 import os
+import re
 import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import warnings
 import itertools
@@ -90,6 +92,8 @@ LANG_CODE_MAP = {
     "yue": "yue",
 }
 SUPPORTED_LANGS = set(LANG_CODE_MAP.values())
+DETECTOR_CHOICES = ("auto", "py3langid", "fast-langdetect")
+DEFAULT_DETECTOR = "auto"
 
 
 def build_translate_parser() -> argparse.ArgumentParser:
@@ -133,6 +137,15 @@ def build_translate_parser() -> argparse.ArgumentParser:
         "--output-lang",
         help="Output language code (e.g. en/ja/zh).",
     )
+    parser.add_argument(
+        "--detector",
+        choices=DETECTOR_CHOICES,
+        default=DEFAULT_DETECTOR,
+        help=(
+            "Language detector backend: auto (default, py3langid with "
+            "fast-langdetect fallback), py3langid, or fast-langdetect."
+        ),
+    )
     parser.add_argument(
         "--max-new-tokens",
         type=int,
@@ -227,6 +240,14 @@ def build_translate_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Stream output tokens (default: off outside interactive mode).",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "Translate each stdin line separately, reusing one loaded "
+            "model for the whole batch."
+        ),
+    )
     return parser
 
 
@@ -365,8 +386,11 @@ def read_text(args: argparse.Namespace) -> str:
 def normalize_lang(value: str | None) -> str | None:
     if value is None:
         return None
-    key = value.strip().lower()
-    normalized = LANG_CODE_MAP.get(key)
+    # Values like "en"/"ja" are already map keys; skip the strip/lower
+    # allocations for that common case.
+    normalized = LANG_CODE_MAP.get(value)
+    if normalized is None:
+        normalized = LANG_CODE_MAP.get(value.strip().lower())
     if normalized is None:
         raise SystemExit(
             f"Unsupported language '{value}'. Supported: {sorted(SUPPORTED_LANGS)}"
@@ -374,10 +398,66 @@ def normalize_lang(value: str | None) -> str | None:
     return normalized
 
 
-def detect_lang(text: str) -> str:
-    from fast_langdetect import detect
+_KANA_RE = re.compile(r"[\u3040-\u30ff]")
+_ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
+
+
+def _shortcut_lang(text: str) -> str | None:
+    # Hiragana/Katakana only occur in Japanese, and pure-ASCII prose is
+    # English for our purposes; both cases skip the FastText model. Han-only
+    # text stays on the model path because it could equally be Chinese.
+    if _KANA_RE.search(text):
+        return "ja"
+    if text.isascii() and _ASCII_LETTER_RE.search(text):
+        return "en"
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_detector():
+    # fast_langdetect pulls in a large FastText model; import it once and
+    # only when detection is actually needed (both languages unspecified).
+    import fast_langdetect
 
-    results = detect(text, k=3, model="auto")
+    return fast_langdetect
+
+
+@functools.lru_cache(maxsize=1)
+def _get_identifier():
+    # py3langid loads a small pickled model, far cheaper than FastText.
+    # Restrict it to the languages the CLI accepts so irrelevant classes
+    # never win.
+    from py3langid.langid import MODEL_FILE, LanguageIdentifier
+
+    identifier = LanguageIdentifier.from_pickled_model(MODEL_FILE)
+    identifier.set_languages(sorted(SUPPORTED_LANGS & set(identifier.nb_classes)))
+    return identifier
+
+
+def _classify_py3langid(text: str) -> str | None:
+    try:
+        identifier = _get_identifier()
+    except Exception:
+        return None
+    lang, _score = identifier.classify(text)
+    if isinstance(lang, str) and lang in SUPPORTED_LANGS:
+        return lang
+    return None
+
+
+def detect_lang(text: str, detector: str = DEFAULT_DETECTOR) -> str:
+    shortcut = _shortcut_lang(text)
+    if shortcut is not None:
+        return shortcut
+
+    if detector != "fast-langdetect":
+        lang = _classify_py3langid(text)
+        if lang is not None:
+            return lang
+        if detector == "py3langid":
+            raise SystemExit("py3langid is not available.")
+
+    results = _get_detector().detect(text, k=3, model="auto")
     if isinstance(results, dict):
         results_iter: Iterable[dict[str, Any]] = [results]
     else:
@@ -399,7 +479,9 @@ def resolve_languages(args: argparse.Namespace, text: str) -> tuple[str, str]:
     output_lang = normalize_lang(args.output_lang)
 
     if input_lang is None and output_lang is None:
-        input_lang = detect_lang(text)
+        input_lang = detect_lang(
+            text, detector=getattr(args, "detector", DEFAULT_DETECTOR)
+        )
         if input_lang == "en":
             output_lang = "ja"
         elif input_lang == "ja":
@@ -439,8 +521,16 @@ def resolve_languages(args: argparse.Namespace, text: str) -> tuple[str, str]:
     return input_lang, output_lang
 
 
-@functools.lru_cache(maxsize=4)
+_MODEL_LOAD_LOCK = threading.Lock()
+
+
 def _load_model(model: str, trust_remote_code: bool):
+    with _MODEL_LOAD_LOCK:
+        return _load_model_cached(model, trust_remote_code)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model_cached(model: str, trust_remote_code: bool):
     from mlx_lm import load
 
     translator = resolve_translation_model(model)
@@ -454,9 +544,51 @@ def _load_model(model: str, trust_remote_code: bool):
     model_obj = loaded[0]
     tokenizer = loaded[1]
     translator.configure_tokenizer(tokenizer)
+    _materialize_parameters(model_obj)
     return model_obj, tokenizer, translator
 
 
+def _canonicalize_model(model_name: str) -> str:
+    # Only names that are unambiguously filesystem paths can be checked
+    # offline; Hugging Face repo ids also contain a slash. Resolving a
+    # local path here gives every spelling of the same directory one
+    # model-cache entry.
+    if not model_name.startswith((".", "/", "~")):
+        return model_name
+    path = Path(model_name).expanduser()
+    if not path.is_dir():
+        raise SystemExit(f"Model directory not found: {model_name}")
+    return str(path.resolve())
+
+
+def _preload_model_async(args: argparse.Namespace) -> None:
+    # Warm the model cache in the background so the load overlaps with
+    # draining stdin; _load_model is cached and lock-protected, so the
+    # later foreground call simply reuses the result.
+    model_name = resolve_model_alias(args.model, DEFAULT_MLX_MODEL)
+
+    def _preload() -> None:
+        try:
+            _load_model(model_name, args.trust_remote_code)
+        except Exception:
+            return
+
+    threading.Thread(target=_preload, daemon=True).start()
+
+
+def _materialize_parameters(model_obj: Any) -> None:
+    # MLX loads lazily; force weights into memory here so the first
+    # generate() call does not pay the disk transfer on its critical path.
+    try:
+        import mlx.core as mx
+    except Exception:
+        return
+    try:
+        mx.eval(model_obj.parameters())
+    except Exception:
+        return
+
+
 def configure_logging(verbose: bool) -> None:
     _patch_mx_device_info()
     if verbose:
@@ -571,6 +703,69 @@ def _build_prompt(
     )
 
 
+_PROMPT_PARTS_CACHE: dict[
+    tuple[str, str, str, bool], tuple[list[int], list[int]] | None
+] = {}
+
+
+def _encode_prompt_parts(
+    translator: Any,
+    tokenizer: Any,
+    src_lang: str,
+    tgt_lang: str,
+    no_chat_template: bool,
+) -> tuple[list[int], list[int]] | None:
+    parts = translator.prompt_parts(
+        tokenizer, src_lang, tgt_lang, no_chat_template
+    )
+    if parts is None:
+        return None
+    prefix, suffix = parts
+    try:
+        prefix_ids = tokenizer.encode(prefix)
+        suffix_ids = tokenizer.encode(suffix, add_special_tokens=False)
+    except Exception:
+        return None
+    return list(prefix_ids), list(suffix_ids)
+
+
+def _encode_prompt_cached(
+    *,
+    translator: Any,
+    tokenizer: Any,
+    model_name: str,
+    text: str,
+    src_lang: str,
+    tgt_lang: str,
+    no_chat_template: bool,
+) -> str | list[int]:
+    # Tokenize the static prompt wrapping once per (model, lang pair) and
+    # only encode the per-line text; falls back to the plain string prompt
+    # when the prompt cannot be split or the tokenizer rejects the parts.
+    key = (model_name, src_lang, tgt_lang, bool(no_chat_template))
+    if key not in _PROMPT_PARTS_CACHE:
+        _PROMPT_PARTS_CACHE[key] = _encode_prompt_parts(
+            translator, tokenizer, src_lang, tgt_lang, no_chat_template
+        )
+    parts = _PROMPT_PARTS_CACHE[key]
+    if parts is not None:
+        prefix_ids, suffix_ids = parts
+        try:
+            text_ids = list(tokenizer.encode(text, add_special_tokens=False))
+        except Exception:
+            parts = None
+        else:
+            return prefix_ids + text_ids + suffix_ids
+    return _build_prompt(
+        translator=translator,
+        tokenizer=tokenizer,
+        text=text,
+        src_lang=src_lang,
+        tgt_lang=tgt_lang,
+        no_chat_template=no_chat_template,
+    )
+
+
 def _resolve_generation_args(
     args: argparse.Namespace, *, translator: Any | None = None
 ) -> dict[str, Any]:
@@ -1306,7 +1501,9 @@ def _run_server(args: argparse.Namespace) -> int:
     os.chmod(socket_path, 0o600)
     sock.listen(SERVER_LISTEN_BACKLOG)
 
-    model_name = resolve_model_alias(args.model, DEFAULT_MLX_MODEL)
+    model_name = _canonicalize_model(
+        resolve_model_alias(args.model, DEFAULT_MLX_MODEL)
+    )
     defaults = _resolve_generation_args(
         args, translator=resolve_translation_model(model_name)
     )
@@ -1353,7 +1550,7 @@ def _server_start(args: argparse.Namespace) -> int:
     socket_path = resolve_socket_path(args.socket)
     log_path = resolve_log_path(args.log_file)
     state_path = resolve_state_path(None)
-    model = resolve_model_alias(args.model, DEFAULT_MLX_MODEL)
+    model = _canonicalize_model(resolve_model_alias(args.model, DEFAULT_MLX_MODEL))
     defaults = _resolve_generation_args(
         args, translator=resolve_translation_model(model)
     )
@@ -1586,7 +1783,12 @@ def _translate_via_server(
 
 
 def _translate_text(
-    text: str, src_lang: str, tgt_lang: str, args: argparse.Namespace
+    text: str,
+    src_lang: str,
+    tgt_lang: str,
+    args: argparse.Namespace,
+    *,
+    batch: bool = False,
 ) -> int:
     server_mode = args.server
     socket_path = resolve_socket_path(args.socket)
@@ -1660,14 +1862,26 @@ def _translate_text(
     model_obj, tokenizer, translator = _load_model(
         args.model, args.trust_remote_code
     )
-    prompt = _build_prompt(
-        translator=translator,
-        tokenizer=tokenizer,
-        text=text,
-        src_lang=src_lang,
-        tgt_lang=tgt_lang,
-        no_chat_template=gen_args["no_chat_template"],
-    )
+    prompt: str | list[int]
+    if batch:
+        prompt = _encode_prompt_cached(
+            translator=translator,
+            tokenizer=tokenizer,
+            model_name=args.model,
+            text=text,
+            src_lang=src_lang,
+            tgt_lang=tgt_lang,
+            no_chat_template=gen_args["no_chat_template"],
+        )
+    else:
+        prompt = _build_prompt(
+            translator=translator,
+            tokenizer=tokenizer,
+            text=text,
+            src_lang=src_lang,
+            tgt_lang=tgt_lang,
+            no_chat_template=gen_args["no_chat_template"],
+        )
     with silence_stderr(not args.verbose):
         if args.stream:
             _stream_text(
@@ -1701,11 +1915,56 @@ def _translate_text(
 
 def _handle_translate(args: argparse.Namespace) -> int:
     configure_logging(args.verbose)
+    # Cheap validation first: reject a bad model path or language code
+    # before reading stdin or loading the language detector.
+    args.model = _canonicalize_model(
+        resolve_model_alias(args.model, DEFAULT_MLX_MODEL)
+    )
+    normalize_lang(args.input_lang)
+    normalize_lang(args.output_lang)
+    if (
+        args.text is None
+        and not sys.stdin.isatty()
+        and (args.server == "never" or args.stream)
+    ):
+        # Direct execution is coming: start loading while stdin drains.
+        _preload_model_async(args)
+    if args.batch:
+        return _run_batch(args)
     text = read_text(args)
     input_lang, output_lang = resolve_languages(args, text)
     return _translate_text(text, input_lang, output_lang, args)
 
 
+def _run_batch(args: argparse.Namespace) -> int:
+    if args.text is not None:
+        raise SystemExit("--batch reads from stdin; do not combine with --text.")
+    if sys.stdin.isatty():
+        raise SystemExit("--batch requires piped stdin input.")
+
+    # The model is loaded once (via the cache or the server) and reused
+    # for every line, so load cost amortizes across the batch.
+    exit_code = 0
+    for line in sys.stdin:
+        line = line.rstrip("\n")
+        if not line.strip():
+            continue
+        try:
+            input_lang, output_lang = resolve_languages(args, line)
+            result = _translate_text(
+                line, input_lang, output_lang, args, batch=True
+            )
+        except SystemExit as exc:
+            # A single undetectable or unsupported line should not abort
+            # the remaining batch.
+            sys.stderr.write(f"[ERROR] Skipping line: {exc}\n")
+            exit_code = 1
+            continue
+        if result != 0:
+            exit_code = result
+    return exit_code
+
+
 def _run_interactive(args: argparse.Namespace) -> int:
     _setup_readline_history()
     args.stream = True
@@ -1742,7 +2001,12 @@ def _setup_readline_history() -> None:
 
 def main() -> int:
     mode, args = parse_args()
-    if mode == "translate" and args.text is None and sys.stdin.isatty():
+    if (
+        mode == "translate"
+        and args.text is None
+        and not args.batch
+        and sys.stdin.isatty()
+    ):
         return _run_interactive(args)
     if mode == "server":
         action = args.action or "start"
@@ -10,6 +10,10 @@ LANG_NAME_MAP = {
     "zh-hant": "Traditional Chinese",
 }
 
+# Placeholder that cannot appear in real input; used to locate the user
+# text inside a rendered prompt so its static wrapping can be cached.
+PROMPT_TEXT_SENTINEL = "\x00PROMPT_TEXT\x00"
+
 
 def normalize_lang_code(code: str) -> str:
     return code.strip().lower().replace("_", "-")
@@ -30,6 +34,10 @@ def trust_remote_code_config(trust_remote_code: bool) -> dict[str, Any]:
 
 class TranslationModel(ABC):
     add_generation_prompt: bool = True
+    # Cached prompt wrapping concatenates the raw user text, so models
+    # whose build_messages transforms the text (e.g. strips whitespace)
+    # must opt out to keep rendering per call.
+    cache_prompt_wrap: bool = True
 
     @classmethod
     @abstractmethod
@@ -61,15 +69,71 @@ class TranslationModel(ABC):
         text: str,
         no_chat_template: bool,
     ) -> str:
-        messages = self.build_messages(src_lang, tgt_lang, text)
-        fallback = self.build_fallback_prompt(src_lang, tgt_lang, text)
         if no_chat_template or not hasattr(tokenizer, "apply_chat_template"):
-            return fallback
+            return self.build_fallback_prompt(src_lang, tgt_lang, text)
+        wrap = self._template_wrap(tokenizer, src_lang, tgt_lang)
+        if wrap is not None:
+            prefix, suffix = wrap
+            return prefix + text + suffix
+        messages = self.build_messages(src_lang, tgt_lang, text)
         return tokenizer.apply_chat_template(
             messages,
             add_generation_prompt=self.add_generation_prompt,
             tokenize=False,
         )
 
+    def _template_wrap(
+        self, tokenizer: Any, src_lang: str, tgt_lang: str
+    ) -> tuple[str, str] | None:
+        # Render the chat template once with a sentinel in place of the
+        # user text; later calls just concatenate around it instead of
+        # re-running Jinja. None means the template moved or duplicated
+        # the text and must be applied per call.
+        if not self.cache_prompt_wrap:
+            return None
+        cache = getattr(self, "_wrap_cache", None)
+        if cache is None:
+            cache = {}
+            self._wrap_cache = cache
+        key = (id(tokenizer), src_lang, tgt_lang)
+        if key not in cache:
+            messages = self.build_messages(src_lang, tgt_lang, PROMPT_TEXT_SENTINEL)
+            rendered = tokenizer.apply_chat_template(
+                messages,
+                add_generation_prompt=self.add_generation_prompt,
+                tokenize=False,
+            )
+            if isinstance(rendered, str) and rendered.count(PROMPT_TEXT_SENTINEL) == 1:
+                prefix, _, suffix = rendered.partition(PROMPT_TEXT_SENTINEL)
+                cache[key] = (prefix, suffix)
+            else:
+                cache[key] = None
+        return cache[key]
+
+    def prompt_parts(
+        self,
+        tokenizer: Any,
+        src_lang: str,
+        tgt_lang: str,
+        no_chat_template: bool,
+    ) -> tuple[str, str] | None:
+        """Split the rendered prompt into the static prefix/suffix around
+        the user text, or None when the prompt shape does not allow it."""
+        if not self.cache_prompt_wrap:
+            # Splicing raw text between cached parts would skip the
+            # model's per-call text normalization.
+            return None
+        rendered = self.render_prompt(
+            tokenizer,
+            src_lang=src_lang,
+            tgt_lang=tgt_lang,
+            text=PROMPT_TEXT_SENTINEL,
+            no_chat_template=no_chat_template,
+        )
+        if rendered.count(PROMPT_TEXT_SENTINEL) != 1:
+            return None
+        prefix, _, suffix = rendered.partition(PROMPT_TEXT_SENTINEL)
+        return prefix, suffix
+
     def default_generation(self) -> dict[str, Any]:
         return {}
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+
 from .base import TranslationModel, lang_name
 
 CAT_PROMPT_TEMPLATE = (
@@ -7,6 +9,17 @@ CAT_PROMPT_TEMPLATE = (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _prompt_prefix(src_lang: str, tgt_lang: str) -> str:
+    # The template only varies in the trailing text, so format the static
+    # part once per language pair and append the text per call.
+    return CAT_PROMPT_TEMPLATE.format(
+        src_lang=lang_name(src_lang),
+        tgt_lang=lang_name(tgt_lang),
+        src_text="",
+    )
+
+
 class CATTranslateModel(TranslationModel):
     add_generation_prompt = True
 
@@ -15,16 +28,8 @@ class CATTranslateModel(TranslationModel):
         return "cat-translate" in model_name.lower()
 
     def build_messages(self, src_lang: str, tgt_lang: str, text: str) -> list[dict[str, str]]:
-        prompt = CAT_PROMPT_TEMPLATE.format(
-            src_lang=lang_name(src_lang),
-            tgt_lang=lang_name(tgt_lang),
-            src_text=text,
-        )
+        prompt = _prompt_prefix(src_lang, tgt_lang) + text
         return [{"role": "user", "content": prompt}]
 
     def build_fallback_prompt(self, src_lang: str, tgt_lang: str, text: str) -> str:
-        return CAT_PROMPT_TEMPLATE.format(
-            src_lang=lang_name(src_lang),
-            tgt_lang=lang_name(tgt_lang),
-            src_text=text,
-        )
+        return _prompt_prefix(src_lang, tgt_lang) + text
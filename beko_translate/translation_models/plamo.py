@@ -42,6 +42,9 @@ def _plamo_lang_name(code: str) -> str:
 
 class PlamoTranslateModel(TranslationModel):
     add_generation_prompt = False
+    # build_messages strips the user text, so cached wraps built from a
+    # sentinel would lose that normalization.
+    cache_prompt_wrap = False
 
     @classmethod
     def supports(cls, model_name: str) -> bool:
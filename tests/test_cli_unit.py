@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import io
 
 import pytest
 
@@ -16,7 +17,7 @@ def test_read_text_from_arg() -> None:
 
 
 def test_resolve_languages_detects_when_missing(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_detect(_: str) -> str:
+    def fake_detect(_: str, detector: str = "auto") -> str:
         return "en"
 
     monkeypatch.setattr(cli, "detect_lang", fake_detect)
@@ -55,6 +56,80 @@ def test_resolve_languages_requires_input_for_non_default_output() -> None:
         cli.resolve_languages(args, "hello")
 
 
+def test_run_batch_translates_each_line(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[str, str, str]] = []
+
+    def fake_translate(text, src_lang, tgt_lang, _args, batch=False):
+        calls.append((text, src_lang, tgt_lang))
+        return 0
+
+    monkeypatch.setattr(cli, "_translate_text", fake_translate)
+    monkeypatch.setattr("sys.stdin", io.StringIO("hello\n\nworld\n"))
+    args = make_args(
+        text=None, batch=True, input_lang="en", output_lang=None, verbose=False
+    )
+    assert cli._run_batch(args) == 0
+    assert calls == [("hello", "en", "ja"), ("world", "en", "ja")]
+
+
+def test_run_batch_continues_after_line_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def fake_resolve(_args, text):
+        if text == "bad":
+            raise SystemExit("Could not detect language.")
+        return ("en", "ja")
+
+    def fake_translate(text, src_lang, tgt_lang, _args, batch=False):
+        calls.append(text)
+        return 0
+
+    monkeypatch.setattr(cli, "resolve_languages", fake_resolve)
+    monkeypatch.setattr(cli, "_translate_text", fake_translate)
+    monkeypatch.setattr("sys.stdin", io.StringIO("ok\nbad\nalso ok\n"))
+    args = make_args(
+        text=None, batch=True, input_lang=None, output_lang=None, verbose=False
+    )
+    assert cli._run_batch(args) == 1
+    assert calls == ["ok", "also ok"]
+
+
+def test_run_batch_rejects_text_arg() -> None:
+    args = make_args(text="hello", batch=True)
+    with pytest.raises(SystemExit):
+        cli._run_batch(args)
+
+
+class SplittingTokenizer:
+    def encode(self, text, add_special_tokens=True):
+        ids = [ord(ch) for ch in text]
+        if add_special_tokens:
+            ids = [1, *ids]
+        return ids
+
+
+def test_encode_prompt_cached_splices_text_tokens() -> None:
+    from beko_translate.translation_models import CATTranslateModel
+
+    cli._PROMPT_PARTS_CACHE.clear()
+    tokenizer = SplittingTokenizer()
+    translator = CATTranslateModel()
+    ids = cli._encode_prompt_cached(
+        translator=translator,
+        tokenizer=tokenizer,
+        model_name="cat",
+        text="abc",
+        src_lang="en",
+        tgt_lang="ja",
+        no_chat_template=True,
+    )
+    expected_prompt = translator.build_fallback_prompt("en", "ja", "abc")
+    assert ids == [1, *[ord(ch) for ch in expected_prompt]]
+    assert ("cat", "en", "ja", True) in cli._PROMPT_PARTS_CACHE
+
+
 def test_detect_lang_prefers_supported(monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_detect(_: str, k: int = 3, model: str | None = None):
         return [
@@ -63,7 +138,7 @@ def test_detect_lang_prefers_supported(monkeypatch: pytest.MonkeyPatch) -> None:
         ]
 
     monkeypatch.setattr("fast_langdetect.detect", fake_detect, raising=False)
-    assert cli.detect_lang("text") == "fr"
+    assert cli.detect_lang("你好", detector="fast-langdetect") == "fr"
 
 
 def test_detect_lang_handles_dict(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -71,4 +146,30 @@ def test_detect_lang_handles_dict(monkeypatch: pytest.MonkeyPatch) -> None:
         return {"lang": "en", "score": 0.7}
 
     monkeypatch.setattr("fast_langdetect.detect", fake_detect, raising=False)
-    assert cli.detect_lang("text") == "en"
+    assert cli.detect_lang("你好", detector="fast-langdetect") == "en"
+
+
+def test_detect_lang_shortcut_skips_detector(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail_detector():
+        raise AssertionError("detector should not be loaded")
+
+    monkeypatch.setattr(cli, "_get_detector", fail_detector)
+    assert cli.detect_lang("これは猫です") == "ja"
+    assert cli.detect_lang("The cat sat on the mat.") == "en"
+
+
+def test_detect_lang_uses_py3langid_before_fasttext(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("py3langid")
+
+    def fail_detector():
+        raise AssertionError("fast_langdetect should not be loaded")
+
+    monkeypatch.setattr(cli, "_get_detector", fail_detector)
+    assert cli.detect_lang("你好世界，这是一个测试。") == "zh"
+
+
+def test_detect_lang_shortcut_leaves_han_only_to_detector() -> None:
+    assert cli._shortcut_lang("你好世界") is None
+    assert cli._shortcut_lang("12345") is None
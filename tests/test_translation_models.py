@@ -39,6 +39,70 @@ def test_cat_render_prompt_uses_chat_template() -> None:
     assert tokenizer.messages is not None
 
 
+class WrappingTokenizer:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def apply_chat_template(self, messages, add_generation_prompt, tokenize):
+        self.calls += 1
+        return "<s>" + messages[0]["content"] + "</s>"
+
+
+def test_render_prompt_caches_template_wrap() -> None:
+    model = CATTranslateModel()
+    tokenizer = WrappingTokenizer()
+    first = model.render_prompt(
+        tokenizer, src_lang="ja", tgt_lang="en", text="猫", no_chat_template=False
+    )
+    second = model.render_prompt(
+        tokenizer, src_lang="ja", tgt_lang="en", text="犬", no_chat_template=False
+    )
+    assert first.startswith("<s>") and first.endswith("猫</s>")
+    assert second.endswith("犬</s>")
+    # The template only ran for the sentinel probe, not per call.
+    assert tokenizer.calls == 1
+
+
+def test_render_prompt_honors_wrap_cache_opt_out() -> None:
+    class StrippingModel(CATTranslateModel):
+        cache_prompt_wrap = False
+
+        def build_messages(self, src_lang, tgt_lang, text):
+            return super().build_messages(src_lang, tgt_lang, text.strip())
+
+    model = StrippingModel()
+    tokenizer = WrappingTokenizer()
+    rendered = model.render_prompt(
+        tokenizer, src_lang="ja", tgt_lang="en", text="猫\n", no_chat_template=False
+    )
+    assert rendered.endswith("猫</s>")
+    model.render_prompt(
+        tokenizer, src_lang="ja", tgt_lang="en", text="犬\n", no_chat_template=False
+    )
+    assert tokenizer.calls == 2
+
+
+def test_plamo_opts_out_of_wrap_cache() -> None:
+    assert PlamoTranslateModel.cache_prompt_wrap is False
+
+
+def test_plamo_prompt_parts_disabled() -> None:
+    model = PlamoTranslateModel()
+    assert model.prompt_parts(object(), "en", "ja", no_chat_template=True) is None
+
+
+def test_cat_prompt_parts_splits_around_text() -> None:
+    model = CATTranslateModel()
+    parts = model.prompt_parts(object(), "ja", "en", no_chat_template=True)
+    assert parts is not None
+    prefix, suffix = parts
+    assert prefix.endswith("into English.\n\n")
+    assert suffix == ""
+    assert model.build_fallback_prompt("ja", "en", "猫です") == (
+        prefix + "猫です" + suffix
+    )
+
+
 def test_plamo_language_mapping_uses_taiwanese() -> None:
     model = PlamoTranslateModel()
     messages = model.build_messages("zh-hant", "en", "測試")